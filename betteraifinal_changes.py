@@ -44,130 +44,14 @@ class MakcuController:
 
 # REPLACE WITH THIS HIGH-PERFORMANCE VERSION:
 
-class MakcuController:
-    """
-    High-Performance MAKCU Controller with C++ Backend
-    =================================================
-    
-    This class provides a drop-in replacement for the original MakcuController
-    with 28x performance improvement using the C++ library.
-    
-    Performance:
-    - Mouse Movement: 0.07ms (vs 2ms original) = 28x faster
-    - Perfect for 360Hz+ gaming
-    - Fire-and-forget architecture for zero delay
-    """
-    
-    def __init__(self):
-        self.connected = False
-        self.cpp_controller = None
-        
-        # Try to use high-performance C++ implementation
-        if MAKCU_CPP_AVAILABLE:
-            try:
-                self.cpp_controller = MakcuControllerReplacement()
-                self.use_cpp = True
-                print("[MAKCU] Initialized with C++ high-performance backend")
-            except Exception as e:
-                print(f"[MAKCU] C++ initialization failed: {e}")
-                self.use_cpp = False
-                self._init_fallback()
-        else:
-            self.use_cpp = False
-            self._init_fallback()
-    
-    def _init_fallback(self):
-        """Initialize fallback Python implementation"""
-        print("[MAKCU] Using fallback Python implementation")
-        # Keep original Python implementation as fallback
-        self.serial = None
-        # ... (keep original __init__ code here)
-    
-    def connect(self):
-        """
-        Connect to MAKCU device with automatic C++/Python selection
-        
-        Returns:
-            bool: True if connected successfully
-        """
-        if self.use_cpp and self.cpp_controller:
-            # Use high-performance C++ implementation
-            try:
-                if self.cpp_controller.connect():
-                    self.connected = True
-                    print("[MAKCU] 🚀 HIGH-PERFORMANCE MODE ACTIVATED")
-                    print("[MAKCU] Performance: 0.07ms movements (28x faster)")
-                    print("[MAKCU] Gaming ready: Perfect for 360Hz+ displays")
-                    return True
-                else:
-                    print("[MAKCU] C++ connection failed, trying fallback...")
-                    return self._connect_fallback()
-            except Exception as e:
-                print(f"[MAKCU] C++ connection error: {e}")
-                return self._connect_fallback()
-        else:
-            return self._connect_fallback()
-    
-    def _connect_fallback(self):
-        """Fallback to original Python implementation"""
-        print("[MAKCU] Using Python fallback connection")
-        # Keep original connect() code here
-        # ... (original connection logic)
-        return False  # Replace with actual fallback logic
-    
-    def move(self, x, y):
-        """
-        Ultra-fast mouse movement optimized for AI aiming
-        
-        This is the critical function called by the AI for mouse movement.
-        With C++ implementation: 0.07ms average (perfect for 360Hz+ gaming)
-        
-        Args:
-            x (int): Horizontal movement delta
-            y (int): Vertical movement delta
-            
-        Returns:
-            bool: True if movement executed successfully
-        """
-        if not self.connected:
-            return False
-        
-        if self.use_cpp and self.cpp_controller:
-            # Use ultra-fast C++ implementation (0.07ms)
-            try:
-                return self.cpp_controller.move(int(x), int(y))
-            except Exception as e:
-                print(f"[MAKCU] C++ movement error: {e}")
-                # Fall back to Python implementation
-                return self._move_fallback(x, y)
-        else:
-            return self._move_fallback(x, y)
-    
-    def _move_fallback(self, x, y):
-        """Fallback to original Python movement"""
-        # Keep original move() code here
-        # ... (original movement logic)
-        return False  # Replace with actual fallback logic
-    
-    def disconnect(self):
-        """Disconnect from MAKCU device"""
-        if self.connected:
-            if self.use_cpp and self.cpp_controller:
-                try:
-                    self.cpp_controller.disconnect()
-                except Exception as e:
-                    print(f"[MAKCU] C++ disconnect error: {e}")
-            else:
-                # Original disconnect logic
-                pass
-            
-            self.connected = False
-            print("[MAKCU] Disconnected")
-    
-    def __del__(self):
-        """Cleanup on destruction"""
-        if self.connected:
-            self.disconnect()
+# The full replacement class now lives in a single shared template:
+#
+#     _template/makcu_controller.py.txt
+#
+# auto_integrate.py loads the same template, so the class is maintained in
+# exactly one place. Copy the template contents verbatim in place of your
+# existing MakcuController class (or just run auto_integrate.py, which does
+# this for you).
 
 # ------------------------------------------------------------------------------
 # STEP 3: NO CHANGES NEEDED TO MOUSE MOVEMENT ROUTING
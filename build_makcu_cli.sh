@@ -1,9 +1,61 @@
 #!/bin/bash
 # Build script for MAKCU CLI interface
 # This creates the executable that the Python wrapper will use
+#
+# Usage: ./build_makcu_cli.sh            - build the makcu_cli executable
+#        ./build_makcu_cli.sh sharedlib  - build libmakcu.so/makcu.dll for ctypes
+#        ./build_makcu_cli.sh pgo        - profile-guided libmakcu.so (g++ only)
 
-echo "Building MAKCU C++ CLI Interface..."
-echo "=================================="
+TARGET="${1:-cli}"
+
+if [[ "$TARGET" == "pgo" ]]; then
+    echo "Building MAKCU Shared Library (profile-guided)..."
+    echo "================================================="
+
+    # GCC-flavoured PGO flags; clang wants llvm-profdata merging and
+    # MSVC has its own /GENPROFILE cycle, so keep this target to g++
+    if [[ "$OSTYPE" != "darwin"* ]] && [[ "$OSTYPE" != "linux-gnu"* ]] || ! command -v g++ &> /dev/null; then
+        echo "❌ Error: the pgo target needs g++ on macOS/Linux"
+        exit 1
+    fi
+
+    PGO_DIR="${PGO_DIR:-/tmp/makcu-pgo}"
+    PGO_SOURCES="makcu_c_api.cpp makcu-cpp/src/makcu.cpp makcu-cpp/src/serialport.cpp"
+
+    echo "Step 1/3: instrumented build (-fprofile-generate=$PGO_DIR)"
+    rm -rf "$PGO_DIR"
+    mkdir -p "$PGO_DIR"
+    if ! g++ -std=c++17 -O3 -shared -fPIC -fprofile-generate="$PGO_DIR" -I. $PGO_SOURCES -o libmakcu.so; then
+        echo "❌ Instrumented build failed"
+        exit 1
+    fi
+
+    echo ""
+    echo "Step 2/3: exercising hot paths (requires a connected MAKCU device)"
+    if ! python3 makcu_python_wrapper.py; then
+        echo "⚠️  Benchmark run failed - rebuilding with whatever profile data was collected"
+    fi
+
+    echo ""
+    echo "Step 3/3: optimized rebuild (-fprofile-use=$PGO_DIR)"
+    if ! g++ -std=c++17 -O3 -shared -fPIC -fprofile-use="$PGO_DIR" -fprofile-correction -I. $PGO_SOURCES -o libmakcu.so; then
+        echo "❌ Profile-guided rebuild failed"
+        exit 1
+    fi
+
+    echo ""
+    echo "✅ PGO build complete: ./libmakcu.so"
+    echo "The Python wrapper picks this library up automatically via ctypes"
+    exit 0
+fi
+
+if [[ "$TARGET" == "sharedlib" ]]; then
+    echo "Building MAKCU Shared Library (ctypes binding)..."
+    echo "================================================="
+else
+    echo "Building MAKCU C++ CLI Interface..."
+    echo "=================================="
+fi
 
 # Check if we're on macOS/Linux
 if [[ "$OSTYPE" == "darwin"* ]] || [[ "$OSTYPE" == "linux-gnu"* ]]; then
@@ -20,20 +72,32 @@ if [[ "$OSTYPE" == "darwin"* ]] || [[ "$OSTYPE" == "linux-gnu"* ]]; then
     fi
     
     echo "Using compiler: $COMPILER"
-    
+
     # Build command for Unix
-    BUILD_CMD="$COMPILER -std=c++17 -O3 -I. makcu_cli.cpp makcu-cpp/src/makcu.cpp makcu-cpp/src/serialport.cpp -o makcu_cli"
-    
+    if [[ "$TARGET" == "sharedlib" ]]; then
+        BUILD_CMD="$COMPILER -std=c++17 -O3 -shared -fPIC -I. makcu_c_api.cpp makcu-cpp/src/makcu.cpp makcu-cpp/src/serialport.cpp -o libmakcu.so"
+    else
+        BUILD_CMD="$COMPILER -std=c++17 -O3 -I. makcu_cli.cpp makcu-cpp/src/makcu.cpp makcu-cpp/src/serialport.cpp -o makcu_cli"
+    fi
+
 elif [[ "$OSTYPE" == "msys" ]] || [[ "$OSTYPE" == "cygwin" ]] || [[ "$OSTYPE" == "win32" ]]; then
     echo "Detected Windows system"
-    
+
     # Check for Visual Studio compiler
     if command -v cl &> /dev/null; then
         echo "Using Visual Studio compiler (cl)"
-        BUILD_CMD="cl /EHsc /O2 /I. makcu_cli.cpp makcu-cpp/src/makcu.cpp makcu-cpp/src/serialport.cpp /Fe:makcu_cli.exe"
+        if [[ "$TARGET" == "sharedlib" ]]; then
+            BUILD_CMD="cl /EHsc /O2 /LD /I. makcu_c_api.cpp makcu-cpp/src/makcu.cpp makcu-cpp/src/serialport.cpp /Fe:makcu.dll"
+        else
+            BUILD_CMD="cl /EHsc /O2 /I. makcu_cli.cpp makcu-cpp/src/makcu.cpp makcu-cpp/src/serialport.cpp /Fe:makcu_cli.exe"
+        fi
     elif command -v g++ &> /dev/null; then
         echo "Using MinGW g++"
-        BUILD_CMD="g++ -std=c++17 -O3 -I. makcu_cli.cpp makcu-cpp/src/makcu.cpp makcu-cpp/src/serialport.cpp -o makcu_cli.exe"
+        if [[ "$TARGET" == "sharedlib" ]]; then
+            BUILD_CMD="g++ -std=c++17 -O3 -shared -I. makcu_c_api.cpp makcu-cpp/src/makcu.cpp makcu-cpp/src/serialport.cpp -o makcu.dll"
+        else
+            BUILD_CMD="g++ -std=c++17 -O3 -I. makcu_cli.cpp makcu-cpp/src/makcu.cpp makcu-cpp/src/serialport.cpp -o makcu_cli.exe"
+        fi
     else
         echo "❌ Error: No C++ compiler found (cl or g++)"
         exit 1
@@ -44,8 +108,14 @@ else
 fi
 
 # Check if source files exist
-if [ ! -f "makcu_cli.cpp" ]; then
-    echo "❌ Error: makcu_cli.cpp not found"
+if [[ "$TARGET" == "sharedlib" ]]; then
+    MAIN_SOURCE="makcu_c_api.cpp"
+else
+    MAIN_SOURCE="makcu_cli.cpp"
+fi
+
+if [ ! -f "$MAIN_SOURCE" ]; then
+    echo "❌ Error: $MAIN_SOURCE not found"
     exit 1
 fi
 
@@ -74,7 +144,27 @@ echo ""
 if eval $BUILD_CMD; then
     echo ""
     echo "✅ Build successful!"
-    
+
+    if [[ "$TARGET" == "sharedlib" ]]; then
+        if [[ "$OSTYPE" == "msys" ]] || [[ "$OSTYPE" == "cygwin" ]] || [[ "$OSTYPE" == "win32" ]]; then
+            LIBRARY="./makcu.dll"
+        else
+            LIBRARY="./libmakcu.so"
+        fi
+
+        if [ -f "$LIBRARY" ]; then
+            echo "✅ Shared library created: $LIBRARY"
+            echo ""
+            echo "🚀 BUILD COMPLETE!"
+            echo "The Python wrapper will now load the library in-process via ctypes"
+            echo "(no child process, no pipe - direct FFI calls into the device layer)"
+        else
+            echo "❌ Build seemed successful but library not found"
+            exit 1
+        fi
+        exit 0
+    fi
+
     # Test the built executable
     if [[ "$OSTYPE" == "msys" ]] || [[ "$OSTYPE" == "cygwin" ]] || [[ "$OSTYPE" == "win32" ]]; then
         EXECUTABLE="./makcu_cli.exe"
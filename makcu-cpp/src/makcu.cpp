@@ -6,9 +6,13 @@
 #include <chrono>
 #include <algorithm>
 #include <cctype>
+#include <cstdio>
 #include <atomic>
 #include <mutex>
 #include <unordered_map>
+#if defined(_MSC_VER) && (defined(_M_IX86) || defined(_M_X64))
+#include <intrin.h>
+#endif
 
 namespace makcu {
 
@@ -25,6 +29,35 @@ namespace makcu {
         0xDE, 0xAD, 0x05, 0x00, 0xA5, 0x00, 0x09, 0x3D, 0x00
     };
 
+    namespace {
+        inline void cpuRelax() {
+#if defined(_MSC_VER) && (defined(_M_IX86) || defined(_M_X64))
+            _mm_pause();
+#elif defined(__x86_64__) || defined(__i386__)
+            __builtin_ia32_pause();
+#else
+            std::this_thread::yield();
+#endif
+        }
+
+        // Acks arrive on the listener thread within microseconds at
+        // 4Mbaud, so blocking on the future immediately mostly buys a
+        // context switch per command. Poll for a short budget first
+        // (~2us) and only fall back to the blocking wait if the ack is
+        // genuinely slow.
+        std::string waitForAck(std::future<std::string>& future) {
+            constexpr int SPIN_BUDGET = 64;
+            for (int i = 0; i < SPIN_BUDGET; ++i) {
+                if (future.wait_for(std::chrono::seconds(0)) ==
+                    std::future_status::ready) {
+                    return future.get();
+                }
+                cpuRelax();
+            }
+            return future.get();
+        }
+    }
+
     // Static member definitions for PerformanceProfiler
     std::atomic<bool> PerformanceProfiler::s_enabled{ false };
     std::mutex PerformanceProfiler::s_mutex;
@@ -105,10 +138,6 @@ namespace makcu {
         Device::MouseButtonCallback mouseButtonCallback;
         Device::ConnectionCallback connectionCallback;
 
-        // Pre-allocated string buffers for move commands
-        mutable std::string moveCommandBuffer;
-        mutable std::mutex moveBufferMutex;
-
         Impl() : serialPort(std::make_unique<SerialPort>())
             , status(ConnectionStatus::DISCONNECTED)
             , connected(false)
@@ -223,19 +252,21 @@ namespace makcu {
             return result;
         }
 
-        // Optimized move command with buffer reuse
+        // Optimized move command with per-thread buffer reuse: no lock
+        // on the hot path, and the buffer keeps its capacity across
+        // calls so steady-state moves allocate nothing (snprintf also
+        // avoids the std::to_string temporaries)
         bool executeMoveCommand(int32_t x, int32_t y) {
-            std::lock_guard<std::mutex> lock(moveBufferMutex);
-            moveCommandBuffer.clear();
-            moveCommandBuffer.reserve(32); // Pre-allocate reasonable size
+            thread_local std::string buffer;
+            thread_local char coords[24];
 
-            moveCommandBuffer = "km.move(";
-            moveCommandBuffer += std::to_string(x);
-            moveCommandBuffer += ",";
-            moveCommandBuffer += std::to_string(y);
-            moveCommandBuffer += ")";
+            buffer.clear();
+            buffer += "km.move(";
+            buffer.append(coords,
+                std::snprintf(coords, sizeof(coords), "%d,%d", x, y));
+            buffer += ')';
 
-            return executeCommand(moveCommandBuffer);
+            return executeCommand(buffer);
         }
 
         // Cache-based lock state management
@@ -403,7 +434,7 @@ namespace makcu {
         auto future = m_impl->serialPort->sendTrackedCommand("km.version()", true,
             std::chrono::milliseconds(100));
         try {
-            return future.get();
+            return waitForAck(future);
         }
         catch (...) {
             return "";
@@ -549,7 +580,15 @@ namespace makcu {
             return false;
         }
 
-        std::string command = "km.wheel(" + std::to_string(delta) + ")";
+        // Same per-thread reuse as executeMoveCommand - wheel events
+        // arrive in bursts when scrolling
+        thread_local std::string command;
+        thread_local char digits[16];
+        command.clear();
+        command += "km.wheel(";
+        command.append(digits,
+            std::snprintf(digits, sizeof(digits), "%d", delta));
+        command += ')';
         return m_impl->executeCommand(command);
     }
 
@@ -706,7 +745,7 @@ namespace makcu {
         auto future = m_impl->serialPort->sendTrackedCommand("km.catch_ml()", true,
             std::chrono::milliseconds(50));
         try {
-            std::string response = future.get();
+            std::string response = waitForAck(future);
             return static_cast<uint8_t>(std::stoi(response));
         }
         catch (...) {
@@ -720,7 +759,7 @@ namespace makcu {
         auto future = m_impl->serialPort->sendTrackedCommand("km.catch_mm()", true,
             std::chrono::milliseconds(50));
         try {
-            std::string response = future.get();
+            std::string response = waitForAck(future);
             return static_cast<uint8_t>(std::stoi(response));
         }
         catch (...) {
@@ -734,7 +773,7 @@ namespace makcu {
         auto future = m_impl->serialPort->sendTrackedCommand("km.catch_mr()", true,
             std::chrono::milliseconds(50));
         try {
-            std::string response = future.get();
+            std::string response = waitForAck(future);
             return static_cast<uint8_t>(std::stoi(response));
         }
         catch (...) {
@@ -748,7 +787,7 @@ namespace makcu {
         auto future = m_impl->serialPort->sendTrackedCommand("km.catch_ms1()", true,
             std::chrono::milliseconds(50));
         try {
-            std::string response = future.get();
+            std::string response = waitForAck(future);
             return static_cast<uint8_t>(std::stoi(response));
         }
         catch (...) {
@@ -762,7 +801,7 @@ namespace makcu {
         auto future = m_impl->serialPort->sendTrackedCommand("km.catch_ms2()", true,
             std::chrono::milliseconds(50));
         try {
-            std::string response = future.get();
+            std::string response = waitForAck(future);
             return static_cast<uint8_t>(std::stoi(response));
         }
         catch (...) {
@@ -795,7 +834,7 @@ namespace makcu {
         auto future = m_impl->serialPort->sendTrackedCommand("km.serial()", true,
             std::chrono::milliseconds(100));
         try {
-            return future.get();
+            return waitForAck(future);
         }
         catch (...) {
             return "";
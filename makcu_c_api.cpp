@@ -0,0 +1,135 @@
+/**
+ * MAKCU C API for In-Process Python Binding
+ * =========================================
+ *
+ * Flat extern "C" surface over the makcu-cpp library so Python can load
+ * it with ctypes.CDLL and call directly into the device layer. Compared
+ * to the CLI pipe transport this removes the child process, the pipe
+ * write and the command framing entirely - each move() becomes a single
+ * FFI call, and ctypes releases the GIL for the duration of the call.
+ *
+ * Build with: ./build_makcu_cli.sh sharedlib  (produces libmakcu.so / makcu.dll)
+ */
+
+#include "makcu-cpp/include/makcu.h"
+#include <cstdint>
+#include <string>
+
+#ifdef _WIN32
+#define MK_EXPORT extern "C" __declspec(dllexport)
+#else
+#define MK_EXPORT extern "C" __attribute__((visibility("default")))
+#endif
+
+namespace {
+    // Single device instance per loaded library, mirroring the CLI's
+    // one-device-per-process model.
+    makcu::Device* g_device = nullptr;
+}
+
+MK_EXPORT bool mk_connect(const char* port) {
+    if (!g_device) {
+        g_device = new makcu::Device();
+    }
+    return g_device->connect(port ? std::string(port) : std::string());
+}
+
+MK_EXPORT void mk_disconnect() {
+    if (g_device) {
+        g_device->disconnect();
+        delete g_device;
+        g_device = nullptr;
+    }
+}
+
+MK_EXPORT bool mk_is_connected() {
+    return g_device && g_device->isConnected();
+}
+
+MK_EXPORT void mk_enable_high_performance(bool enable) {
+    if (g_device) {
+        g_device->enableHighPerformanceMode(enable);
+    }
+}
+
+MK_EXPORT bool mk_move(int16_t x, int16_t y) {
+    if (!g_device || !g_device->isConnected()) {
+        return false;
+    }
+    g_device->mouseMove(x, y);
+    return true;
+}
+
+MK_EXPORT bool mk_move_packed(uint32_t packed) {
+    if (!g_device || !g_device->isConnected()) {
+        return false;
+    }
+    // Low half-word is x, high half-word is y, both int16
+    g_device->mouseMove(static_cast<int16_t>(packed & 0xFFFFu),
+                        static_cast<int16_t>(packed >> 16));
+    return true;
+}
+
+MK_EXPORT bool mk_move_path(const int16_t* deltas, int32_t count) {
+    if (!g_device || !g_device->isConnected()) {
+        return false;
+    }
+    for (int32_t i = 0; i < count; ++i) {
+        g_device->mouseMove(deltas[2 * i], deltas[2 * i + 1]);
+    }
+    return true;
+}
+
+MK_EXPORT bool mk_move_smooth(int16_t x, int16_t y, uint8_t segments) {
+    if (!g_device || !g_device->isConnected()) {
+        return false;
+    }
+    g_device->mouseMoveSmooth(x, y, segments);
+    return true;
+}
+
+MK_EXPORT bool mk_click(uint8_t button) {
+    if (!g_device || !g_device->isConnected()) {
+        return false;
+    }
+    g_device->click(static_cast<makcu::MouseButton>(button));
+    return true;
+}
+
+MK_EXPORT bool mk_press(uint8_t button) {
+    if (!g_device || !g_device->isConnected()) {
+        return false;
+    }
+    g_device->mouseDown(static_cast<makcu::MouseButton>(button));
+    return true;
+}
+
+MK_EXPORT bool mk_release(uint8_t button) {
+    if (!g_device || !g_device->isConnected()) {
+        return false;
+    }
+    g_device->mouseUp(static_cast<makcu::MouseButton>(button));
+    return true;
+}
+
+MK_EXPORT bool mk_scroll(int16_t delta) {
+    if (!g_device || !g_device->isConnected()) {
+        return false;
+    }
+    g_device->mouseWheel(delta);
+    return true;
+}
+
+MK_EXPORT bool mk_lock_x(bool lock) {
+    if (!g_device || !g_device->isConnected()) {
+        return false;
+    }
+    return g_device->lockMouseX(lock);
+}
+
+MK_EXPORT bool mk_lock_y(bool lock) {
+    if (!g_device || !g_device->isConnected()) {
+        return false;
+    }
+    return g_device->lockMouseY(lock);
+}
@@ -17,6 +17,18 @@
 #include <sstream>
 #include <map>
 #include <chrono>
+#include <cstdint>
+
+#ifdef _WIN32
+#include <io.h>
+#include <fcntl.h>
+#else
+#include <atomic>
+#include <thread>
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <unistd.h>
+#endif
 
 // Global device instance for persistent connection
 static makcu::Device* g_device = nullptr;
@@ -243,15 +255,251 @@ int executeCommand(const Command& cmd) {
     }
 }
 
+/**
+ * Binary opcodes for the hot path. All values sit below 0x20 so a frame's
+ * first byte can never be confused with the first byte of a text command;
+ * control commands (connect, status, ...) stay newline-framed text.
+ *
+ * Frame layout (6 bytes, little-endian): opcode:u8, aux:u8, x:i16, y:i16
+ */
+enum BinaryOpcode : unsigned char {
+    OP_MOVE = 0x01,
+    OP_CLICK = 0x02,
+    OP_PRESS = 0x03,
+    OP_RELEASE = 0x04,
+    OP_SCROLL = 0x05,
+    OP_MOVE_SMOOTH = 0x06,
+    // Followed by x (= point count) pairs of little-endian i16 deltas
+    OP_BATCH_MOVE = 0x07
+};
+
+static int16_t readInt16LE(const unsigned char* p) {
+    return static_cast<int16_t>(p[0] | (p[1] << 8));
+}
+
+/**
+ * Dispatch one decoded hot-path operation against the device. Shared by
+ * the binary stdin framing and the shared-memory ring.
+ */
+void dispatchHotOp(unsigned char opcode, unsigned char aux, int16_t x, int16_t y) {
+    switch (opcode) {
+    case OP_MOVE:
+        g_device->mouseMove(x, y);
+        break;
+    case OP_CLICK:
+        g_device->click(static_cast<makcu::MouseButton>(aux));
+        break;
+    case OP_PRESS:
+        g_device->mouseDown(static_cast<makcu::MouseButton>(aux));
+        break;
+    case OP_RELEASE:
+        g_device->mouseUp(static_cast<makcu::MouseButton>(aux));
+        break;
+    case OP_SCROLL:
+        g_device->mouseWheel(x);
+        break;
+    case OP_MOVE_SMOOTH:
+        g_device->mouseMoveSmooth(x, y, aux);
+        break;
+    default:
+        break;
+    }
+}
+
+/**
+ * Read and dispatch the remainder of a binary frame. Returns false only
+ * on a truncated stream (EOF mid-frame).
+ */
+bool executeBinaryFrame(unsigned char opcode) {
+    unsigned char payload[5];
+    std::cin.read(reinterpret_cast<char*>(payload), sizeof(payload));
+    if (std::cin.gcount() != sizeof(payload)) {
+        return false;
+    }
+
+    const unsigned char aux = payload[0];
+    const int16_t x = readInt16LE(payload + 1);
+    const int16_t y = readInt16LE(payload + 3);
+
+    if (opcode == OP_BATCH_MOVE) {
+        // The point data must be consumed even while disconnected or
+        // the stream desynchronizes
+        const int16_t count = x > 0 ? x : 0;
+        std::vector<char> points(static_cast<size_t>(count) * 4);
+        std::cin.read(points.data(), points.size());
+        if (std::cin.gcount() != static_cast<std::streamsize>(points.size())) {
+            return false;
+        }
+        if (g_device && g_device->isConnected()) {
+            const unsigned char* p = reinterpret_cast<const unsigned char*>(points.data());
+            for (int16_t i = 0; i < count; ++i, p += 4) {
+                g_device->mouseMove(readInt16LE(p), readInt16LE(p + 2));
+            }
+        }
+        return true;
+    }
+
+    if (!g_device || !g_device->isConnected()) {
+        return true;  // Swallow hot-path ops while disconnected
+    }
+
+    dispatchHotOp(opcode, aux, x, y);
+    return true;
+}
+
+#ifndef _WIN32
+/**
+ * Shared-memory command ring (POSIX only, opt-in via --shm).
+ *
+ * Layout: head u32 (written by Python) | tail u32 (written here) |
+ * 1024 slots of 8 bytes {op:u8, aux:u8, x:i16, y:i16, pad:2}. Handoff
+ * is a store plus head increment on the producer side - no pipe
+ * syscall at all for hot ops; control commands stay on stdin.
+ */
+static constexpr uint32_t SHM_SLOTS = 1024;
+static constexpr size_t SHM_SLOT_SIZE = 8;
+static constexpr size_t SHM_SIZE = 8 + SHM_SLOTS * SHM_SLOT_SIZE;
+
+static volatile bool g_shmStop = false;
+
+void shmPollLoop(std::string name) {
+    if (name.empty()) {
+        return;
+    }
+    if (name[0] != '/') {
+        name.insert(name.begin(), '/');
+    }
+
+    int fd = shm_open(name.c_str(), O_RDWR, 0600);
+    if (fd < 0) {
+        return;
+    }
+    void* mem = mmap(nullptr, SHM_SIZE, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+    ::close(fd);
+    if (mem == MAP_FAILED) {
+        return;
+    }
+
+    auto* head = reinterpret_cast<std::atomic<uint32_t>*>(mem);
+    auto* tail = reinterpret_cast<std::atomic<uint32_t>*>(static_cast<char*>(mem) + 4);
+    const unsigned char* slots = static_cast<const unsigned char*>(mem) + 8;
+
+    while (!g_shmStop) {
+        uint32_t h = head->load(std::memory_order_acquire);
+        uint32_t t = tail->load(std::memory_order_relaxed);
+        if (t == h) {
+            // Hybrid poll: short sleep instead of a pure busy-wait so an
+            // idle ring does not pin a core
+            std::this_thread::sleep_for(std::chrono::microseconds(50));
+            continue;
+        }
+        if (h - t > SHM_SLOTS) {
+            // More pending slots than the ring holds means we caught
+            // the producer's head store mid-update (a torn read puts h
+            // behind t and the unsigned difference wraps). Re-poll
+            // rather than spin through ~2^32 stale dispatches.
+            continue;
+        }
+        while (t != h) {
+            const unsigned char* s = slots + (t & (SHM_SLOTS - 1)) * SHM_SLOT_SIZE;
+            if (g_device && g_device->isConnected()) {
+                dispatchHotOp(s[0], s[1], readInt16LE(s + 2), readInt16LE(s + 4));
+            }
+            ++t;
+        }
+        tail->store(t, std::memory_order_release);
+    }
+
+    munmap(mem, SHM_SIZE);
+}
+#endif
+
+/**
+ * Persistent stdin mode: read commands from stdin and dispatch them
+ * against the long-lived device connection. This lets the Python
+ * wrapper spawn one process per session instead of one per command,
+ * removing the CreateProcess/fork cost from every move().
+ *
+ * Hot-path operations arrive as fixed-size binary frames (no text
+ * parsing); control commands remain newline-framed text.
+ */
+int runStdinMode(const char* shmName = nullptr) {
+    std::ios::sync_with_stdio(false);
+
+#ifdef _WIN32
+    // Binary frames must not be mangled by CRLF translation
+    _setmode(_fileno(stdin), _O_BINARY);
+    (void)shmName;  // Shared-memory ring is POSIX only
+#else
+    std::thread shmThread;
+    if (shmName) {
+        shmThread = std::thread(shmPollLoop, std::string(shmName));
+    }
+#endif
+
+    int c;
+    std::string line;
+    while ((c = std::cin.get()) != EOF) {
+        const unsigned char first = static_cast<unsigned char>(c);
+
+        if (first >= OP_MOVE && first <= OP_BATCH_MOVE) {
+            if (!executeBinaryFrame(first)) {
+                break;
+            }
+            continue;
+        }
+
+        if (first == '\n' || first == '\r') {
+            continue;
+        }
+
+        line.clear();
+        line.push_back(static_cast<char>(first));
+        std::string rest;
+        if (std::getline(std::cin, rest)) {
+            if (!rest.empty() && rest.back() == '\r') {
+                rest.pop_back();
+            }
+            line += rest;
+        }
+
+        if (line == "quit" || line == "exit") {
+            break;
+        }
+        executeCommand(parseCommand(line));
+    }
+
+#ifndef _WIN32
+    if (shmThread.joinable()) {
+        g_shmStop = true;
+        shmThread.join();
+    }
+#endif
+
+    return 0;
+}
+
 /**
  * Main entry point for CLI interface
  */
 int main(int argc, char* argv[]) {
     // Set up cleanup handler
     std::atexit(cleanupDevice);
-    
+
+    if (argc >= 2 && std::string(argv[1]) == "--stdin-mode") {
+        const char* shmName = nullptr;
+        if (argc >= 4 && std::string(argv[2]) == "--shm") {
+            shmName = argv[3];
+        }
+        return runStdinMode(shmName);
+    }
+
     if (argc < 3 || std::string(argv[1]) != "--command") {
         std::cout << "Usage: " << argv[0] << " --command <command_string>" << std::endl;
+        std::cout << "       " << argv[0] << " --stdin-mode" << std::endl;
+        std::cout << std::endl;
+        std::cout << "  --stdin-mode reads newline-framed commands from stdin until" << std::endl;
+        std::cout << "  EOF/quit - intended for long-lived wrapper processes." << std::endl;
         std::cout << std::endl;
         std::cout << "Commands:" << std::endl;
         std::cout << "  connect[:port]                 - Connect to device" << std::endl;
@@ -10,23 +10,179 @@ Performance: 0.07ms mouse movements (28x faster than Python makcu-py-lib)
 Ideal for 360Hz+ gaming and competitive scenarios.
 """
 
+import asyncio
+import ctypes
+import logging
+import selectors
 import subprocess
 import json
 import os
+import struct
 import sys
 import threading
 import time
+from array import array
 from typing import Optional, Tuple, List
 from enum import Enum
 
 
+# Binary hot-path protocol shared with makcu_cli.cpp: 6-byte little-endian
+# frames (opcode:u8, aux:u8, x:i16, y:i16). Opcodes sit below 0x20 so they
+# can never collide with the first byte of a text command.
+# Status messages go through a standard logger instead of print(): the
+# effective level defaults to WARNING, so the latency-critical paths never
+# touch the Python I/O stack unless a user opts in to INFO/DEBUG.
+_logger = logging.getLogger("makcu")
+
+_FRAME = struct.Struct('<BBhh')
+_OP_MOVE = 0x01
+_OP_CLICK = 0x02
+_OP_PRESS = 0x03
+_OP_RELEASE = 0x04
+_OP_SCROLL = 0x05
+_OP_MOVE_SMOOTH = 0x06
+_OP_BATCH_MOVE = 0x07  # Header frame; x carries the point count
+
+# Click/press/release frames carry no coordinates, so all fifteen
+# (opcode, button) combinations are packed once at import - the hot path
+# just queues ready-made bytes instead of calling struct.pack
+_STATIC_FRAMES = {
+    (opcode, button): _FRAME.pack(opcode, button, 0, 0)
+    for opcode in (_OP_CLICK, _OP_PRESS, _OP_RELEASE)
+    for button in range(5)
+}
+
+# Outgoing frame ring: fixed pool of preallocated slots indexed by
+# free-running head/tail counters (power of two so wrapping is a mask).
+# Steady-state moves allocate nothing - producers pack into a reused
+# slot; if producers lap the writer, the oldest moves are dropped and
+# the latest position wins.
+_RING_SLOTS = 1024
+_RING_MASK = _RING_SLOTS - 1
+
+# Shared-memory command ring (POSIX only, opt-in via MAKCU_SHM=1): hot
+# ops are handed to the child through a mapped ring instead of the pipe,
+# so the steady-state cost is a slot store plus a head increment - no
+# syscall at all. Layout matches shmPollLoop in makcu_cli.cpp:
+# head u32 | tail u32 | 1024 slots of {op:u8, aux:u8, x:i16, y:i16, pad:2}.
+# The counters are accessed through a memoryview cast to 'I' (a single
+# aligned 4-byte load/store), never via struct pack/unpack - explicit-
+# endian struct packing writes the bytes one at a time, and the child's
+# atomic reads can observe a torn, half-updated head.
+_SHM_SLOT = struct.Struct('<BBhh2x')
+_SHM_SLOTS = 1024
+_SHM_MASK = _SHM_SLOTS - 1
+_SHM_SIZE = 8 + _SHM_SLOTS * _SHM_SLOT.size
+
+
+def _create_shm_ring():
+    """Create the shared-memory command ring when opted in.
+
+    Returns the SharedMemory block, or None when unsupported (Windows),
+    not requested, or creation failed - callers then stay on the pipe.
+    """
+    if sys.platform == "win32" or os.environ.get("MAKCU_SHM") != "1":
+        return None
+    try:
+        from multiprocessing import shared_memory
+        shm = shared_memory.SharedMemory(
+            name=f"makcu_ring_{os.getpid()}", create=True, size=_SHM_SIZE)
+    except (ImportError, OSError):
+        return None
+    shm.buf[:8] = b"\x00" * 8  # head = tail = 0
+    return shm
+
+
+def _clamp_i16(value: int) -> int:
+    """Clamp a delta into the int16 range carried by a frame"""
+    return -32768 if value < -32768 else (32767 if value > 32767 else value)
+
+
+# Shared library produced by "./build_makcu_cli.sh sharedlib". When present,
+# the wrapper calls straight into the C++ device layer via ctypes instead of
+# piping commands to a child process.
+_LIB_SEARCH_PATHS = [
+    "./libmakcu.so",
+    "./makcu.dll",
+    "./makcu-cpp/libmakcu.so",
+    "./makcu-cpp/makcu.dll",
+]
+
+# (exported name, argtypes, restype) for every mk_* entry point
+_LIB_SIGNATURES = [
+    ("mk_connect", [ctypes.c_char_p], ctypes.c_bool),
+    ("mk_disconnect", [], None),
+    ("mk_is_connected", [], ctypes.c_bool),
+    ("mk_enable_high_performance", [ctypes.c_bool], None),
+    ("mk_move", [ctypes.c_int16, ctypes.c_int16], ctypes.c_bool),
+    ("mk_move_packed", [ctypes.c_uint32], ctypes.c_bool),
+    ("mk_move_smooth", [ctypes.c_int16, ctypes.c_int16, ctypes.c_uint8], ctypes.c_bool),
+    ("mk_move_path", [ctypes.POINTER(ctypes.c_int16), ctypes.c_int32], ctypes.c_bool),
+    ("mk_click", [ctypes.c_uint8], ctypes.c_bool),
+    ("mk_press", [ctypes.c_uint8], ctypes.c_bool),
+    ("mk_release", [ctypes.c_uint8], ctypes.c_bool),
+    ("mk_scroll", [ctypes.c_int16], ctypes.c_bool),
+    ("mk_lock_x", [ctypes.c_bool], ctypes.c_bool),
+    ("mk_lock_y", [ctypes.c_bool], ctypes.c_bool),
+]
+
+
+# Resolved executable path, discovered once per process (see
+# MakcuCppWrapper._find_executable)
+_CACHED_EXE = None
+
+
+def _load_library() -> Optional[ctypes.CDLL]:
+    """Load the in-process makcu library if it has been built.
+
+    Returns the configured CDLL, or None when no library is available
+    (the wrapper then falls back to the persistent CLI pipe transport).
+    """
+    for path in _LIB_SEARCH_PATHS:
+        if not os.path.exists(path):
+            continue
+        try:
+            lib = ctypes.CDLL(os.path.abspath(path))
+            for name, argtypes, restype in _LIB_SIGNATURES:
+                func = getattr(lib, name)
+                func.argtypes = argtypes
+                func.restype = restype
+            return lib
+        except (OSError, AttributeError):
+            continue  # Stale or incompatible build - try the next candidate
+    return None
+
+
+# Button codes matching the C++ MouseButton enum. Plain module-level ints:
+# reading these costs a single global load, where Enum member access plus
+# .value is several dict/attribute lookups per call.
+LEFT = 0
+RIGHT = 1
+MIDDLE = 2
+SIDE1 = 3
+SIDE2 = 4
+
+# Name-to-code map for the string-based MakcuControllerReplacement.click API
+_BUTTONS = {
+    "left": LEFT,
+    "right": RIGHT,
+    "middle": MIDDLE,
+    "side1": SIDE1,
+    "side2": SIDE2,
+}
+
+
 class MouseButton(Enum):
-    """Mouse button enumeration matching C++ implementation"""
-    LEFT = 0
-    RIGHT = 1
-    MIDDLE = 2
-    SIDE1 = 3
-    SIDE2 = 4
+    """Mouse button enumeration matching C++ implementation.
+
+    Kept for compatibility; the hot path uses the module-level int
+    constants directly.
+    """
+    LEFT = LEFT
+    RIGHT = RIGHT
+    MIDDLE = MIDDLE
+    SIDE1 = SIDE1
+    SIDE2 = SIDE2
 
 
 class MakcuCppWrapper:
@@ -38,9 +194,17 @@ class MakcuCppWrapper:
     
     Performance characteristics:
     - Mouse movement: ~0.07ms average
-    - Button clicks: ~0.16ms average  
+    - Button clicks: ~0.16ms average
     - Wheel scroll: ~0.05ms average
     - Perfect for 360Hz+ gaming
+
+    Threading and the GIL: no transport I/O happens under the GIL on a
+    caller thread. ctypes releases the GIL for the duration of every
+    shared-library call, and on the pipe transport callers only append
+    to the ring (a short producer lock orders concurrent appends, held
+    only for the slot store) - the writer thread performs the os.write,
+    which drops the GIL for the syscall. AI and vision threads
+    therefore never serialize on mouse I/O.
     """
     
     def __init__(self, exe_path: Optional[str] = None):
@@ -50,19 +214,67 @@ class MakcuCppWrapper:
         Args:
             exe_path: Path to the makcu-cpp executable. If None, auto-detects.
         """
+        self._lib = _load_library()  # In-process ctypes binding, if built
+        # Raw FFI pointers for the hot ops, cached by connect() so the
+        # specialized paths skip the per-call CDLL attribute lookup
+        self._mk_move = None
+        self._mk_click = None
+        self._mk_scroll = None
         self.exe_path = exe_path or self._find_executable()
         self.connected = False
         self.port = ""
         self._lock = threading.Lock()
-        
-        if not self.exe_path or not os.path.exists(self.exe_path):
-            raise FileNotFoundError(
-                f"MAKCU C++ executable not found at: {self.exe_path}\n"
-                "Please build the makcu-cpp project first or specify correct path."
-            )
+        self._proc = None  # Long-lived --stdin-mode child process
+        self._stdin_fd = -1
+        self._sel = None  # Readiness selector for response reads (POSIX)
+
+        # MPSC ring between callers and the writer thread: a fixed pool
+        # of 6-byte slots plus free-running head (producer) and tail
+        # (writer) counters. Producers pack into a preallocated slot and
+        # bump head under a short producer lock - callers can be
+        # arbitrary threads (AI, vision), and pack-then-bump is not
+        # atomic under the GIL. No allocation on the hot path; the
+        # writer thread is the only consumer and owns tail lock-free.
+        self._slots = [bytearray(_FRAME.size) for _ in range(_RING_SLOTS)]
+        self._head = 0
+        self._tail = 0
+        self._produce_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._writer = None
+        self._writer_stop = False
+
+        # Optional shared-memory ring (created in _start_process); the
+        # producer-side head counter is authoritative here since Python
+        # is the only writer of slots (all under _produce_lock).
+        # _shm_u32 is the buffer cast to uint32 ([0]=head, [1]=tail) so
+        # counter accesses are single aligned 4-byte loads/stores.
+        self._shm = None
+        self._shm_u32 = None
+        self._shm_head = 0
+
+        # Transport failures bump a counter instead of printing so the
+        # error path stays off the Python I/O stack; see get_stats()
+        self._errors = 0
+
+        if self._lib is None:
+            try:
+                os.stat(self.exe_path)  # Single probe instead of exists() re-checks
+            except OSError:
+                raise FileNotFoundError(
+                    f"MAKCU C++ executable not found at: {self.exe_path}\n"
+                    "Please build the makcu-cpp project first or specify correct path."
+                )
     
     def _find_executable(self) -> str:
-        """Auto-detect the makcu-cpp executable path"""
+        """Auto-detect the makcu-cpp executable path.
+
+        The resolved path is cached at module scope so reconnects and
+        repeated wrapper construction skip the filesystem probes.
+        """
+        global _CACHED_EXE
+        if _CACHED_EXE is not None:
+            return _CACHED_EXE
+
         possible_paths = [
             # Windows paths
             "./makcu-cpp/x64/Release/makcu-cpp.exe",
@@ -79,44 +291,258 @@ class MakcuCppWrapper:
         ]
         
         for path in possible_paths:
-            if os.path.exists(path):
-                return os.path.abspath(path)
-        
+            try:
+                os.stat(path)
+            except OSError:
+                continue
+            _CACHED_EXE = os.path.abspath(path)
+            return _CACHED_EXE
+
         return ""
     
-    def _execute_command(self, command: str, expect_response: bool = False) -> Optional[str]:
+    def _start_process(self) -> None:
+        """Start the long-lived C++ child process in stdin mode.
+
+        One process per session instead of one per command: every
+        subsequent command is a pipe write (microseconds) rather than a
+        process spawn (tens of milliseconds on Windows).
+
+        The serial port is opened by the child itself (SerialPort owns
+        the per-platform open/negotiate sequence). Pre-opening the port
+        here and passing the fd via pass_fds would only shave the
+        once-per-session spawn, and on Windows would need inherited
+        handle lists - not worth a second owner of the port handle.
         """
-        Execute a command using the C++ executable.
-        
+        if self._proc is not None and self._proc.poll() is None:
+            return
+
+        popen_kwargs = {}
+        if sys.platform == "win32":
+            # Suppress the console window flash for the background child
+            popen_kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+
+        self._shm = _create_shm_ring()
+        self._shm_u32 = self._shm.buf.cast('I') if self._shm is not None else None
+        self._shm_head = 0
+        args = [self.exe_path, "--stdin-mode"]
+        if self._shm is not None:
+            args += ["--shm", self._shm.name]
+
+        self._proc = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,  # Unbuffered pipes - commands hit the child immediately
+            close_fds=True,
+            **popen_kwargs
+        )
+
+        # Raw fd for os.write - skips Python's buffered io layer entirely
+        self._stdin_fd = self._proc.stdin.fileno()
+
+        if sys.platform != "win32":
+            # Pipe fds are selectable on POSIX, so response reads can
+            # carry a real timeout; Windows keeps the blocking readline
+            self._sel = selectors.DefaultSelector()
+            self._sel.register(self._proc.stdout, selectors.EVENT_READ)
+
+        self._head = 0
+        self._tail = 0
+        self._writer_stop = False
+        self._wake.clear()
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="makcu-writer", daemon=True)
+        self._writer.start()
+
+    def _stop_process(self) -> None:
+        """Tear down the writer thread and child process"""
+        if self._writer is not None:
+            self._writer_stop = True  # Writer drains, then exits
+            self._wake.set()
+            self._writer.join(timeout=1.0)
+            self._writer = None
+
+        if self._proc is None:
+            return
+        try:
+            if self._proc.poll() is None:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=1.0)
+        except (subprocess.TimeoutExpired, OSError):
+            self._proc.kill()
+        self._proc = None
+
+        if self._sel is not None:
+            self._sel.close()
+            self._sel = None
+
+        if self._shm is not None:
+            try:
+                if self._shm_u32 is not None:
+                    self._shm_u32.release()  # Cast view pins the mapping
+                self._shm.close()
+                self._shm.unlink()
+            except OSError:
+                pass
+            self._shm_u32 = None
+            self._shm = None
+
+    def _writer_loop(self) -> None:
+        """Drain queued frames and write them to the child's stdin.
+
+        Runs on a dedicated daemon thread so callers never block on pipe
+        I/O. Consecutive queued moves are coalesced by summing their
+        deltas, and each drain pass goes out as a single pipe write. If
+        producers lapped the ring since the last pass, the overwritten
+        (oldest) entries are simply skipped - for movement deltas the
+        latest position wins.
+        """
+        slots = self._slots
+        wake = self._wake
+        pack = _FRAME.pack
+        unpack_from = _FRAME.unpack_from
+
+        while True:
+            wake.wait()
+            wake.clear()
+
+            head = self._head
+            tail = self._tail
+            if head - tail > _RING_SLOTS:
+                tail = head - _RING_SLOTS  # Lapped: drop-oldest
+
+            frames = []
+            while tail != head:
+                opcode, aux, x, y = unpack_from(slots[tail & _RING_MASK])
+                tail += 1
+                if opcode == _OP_MOVE:
+                    # Sum immediately following moves into one frame
+                    while tail != head:
+                        nxt, _, nx, ny = unpack_from(slots[tail & _RING_MASK])
+                        if nxt != _OP_MOVE:
+                            break
+                        x += nx
+                        y += ny
+                        tail += 1
+                    frames.append(pack(_OP_MOVE, 0, _clamp_i16(x), _clamp_i16(y)))
+                else:
+                    frames.append(pack(opcode, aux, x, y))
+            self._tail = tail
+
+            if frames:
+                payload = frames[0] if len(frames) == 1 else b"".join(frames)
+                try:
+                    with self._lock:
+                        if self._proc is not None and self._proc.poll() is None:
+                            os.write(self._stdin_fd, payload)
+                except (subprocess.SubprocessError, OSError, ValueError) as e:
+                    self._errors += 1
+                    _logger.debug("Pipe write failed: %s", e)
+
+            if self._writer_stop:
+                return
+
+    def _shm_put(self, opcode: int, aux: int, x: int, y: int) -> bool:
+        """Write one hot op into the shared-memory ring.
+
+        Caller must hold _produce_lock - the head read-pack-bump
+        sequence is not atomic across threads. Returns False when the
+        ring is full (child lagging) so the caller falls back to the
+        pipe path for this op.
+        """
+        u32 = self._shm_u32
+        head = self._shm_head
+        tail = u32[1]
+        if (head - tail) & 0xFFFFFFFF >= _SHM_SLOTS:
+            return False
+        _SHM_SLOT.pack_into(self._shm.buf,
+                            8 + (head & _SHM_MASK) * _SHM_SLOT.size,
+                            opcode, aux, _clamp_i16(x), _clamp_i16(y))
+        head = (head + 1) & 0xFFFFFFFF
+        self._shm_head = head
+        # Publish after the slot store, as one aligned 4-byte store -
+        # bytewise packing could be observed torn by the child's atomic
+        u32[0] = head
+        return True
+
+    def _shm_pending(self) -> bool:
+        """True while the child has unconsumed shared-memory slots"""
+        return (self._shm is not None
+                and self._shm_u32[1] != self._shm_head)
+
+    def _drain_ring(self, timeout: float = 0.05) -> None:
+        """Wait briefly for queued frames to reach the child.
+
+        Called before text commands so control traffic cannot overtake
+        hot-path frames queued ahead of it, on either the writer ring
+        or the shared-memory ring.
+        """
+        deadline = time.perf_counter() + timeout
+        while ((self._tail != self._head or self._shm_pending())
+               and time.perf_counter() < deadline):
+            time.sleep(0)
+
+    def _execute_command(self, command: str, expect_response: bool = False,
+                         response_timeout: float = 0.05) -> Optional[str]:
+        """
+        Execute a command over the persistent child's stdin pipe.
+
         Args:
             command: Command to execute
             expect_response: Whether to wait for and return response
-            
+            response_timeout: How long to wait for the child to become
+                readable (POSIX; Windows reads block without a timeout)
+
         Returns:
             Command response if expect_response=True, None otherwise
         """
         try:
+            self._drain_ring()
             with self._lock:
-                if expect_response:
-                    # For commands that need responses (connection, queries)
-                    result = subprocess.run(
-                        [self.exe_path, "--command", command],
-                        capture_output=True,
-                        text=True,
-                        timeout=1.0  # 1 second timeout
-                    )
-                    return result.stdout.strip() if result.returncode == 0 else None
-                else:
-                    # Fire-and-forget for maximum performance (gaming mode)
-                    subprocess.Popen(
-                        [self.exe_path, "--command", command],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL
-                    )
+                if self._proc is None or self._proc.poll() is not None:
                     return None
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
-            print(f"[MAKCU] Command execution error: {e}")
+
+                os.write(self._stdin_fd, (command + "\n").encode())
+
+                if expect_response:
+                    if self._sel is not None and not self._sel.select(response_timeout):
+                        self._errors += 1
+                        _logger.debug("No response to %r within %.0fms",
+                                      command, response_timeout * 1000)
+                        return None
+                    line = self._proc.stdout.readline()
+                    return line.decode().strip() if line else None
+                return None
+        except (subprocess.SubprocessError, OSError, ValueError) as e:
+            self._errors += 1
+            _logger.debug("Command execution failed: %s", e)
             return None
+
+    def _send_frame(self, opcode: int, aux: int = 0, x: int = 0, y: int = 0) -> bool:
+        """
+        Queue a fixed-size binary frame for a hot-path operation.
+
+        The caller packs into a preallocated ring slot and bumps head
+        under the producer lock (pack-then-bump is not atomic between
+        caller threads); no allocation on this path. The writer thread
+        owns tail and performs the actual pipe write.
+        """
+        if self._writer is None:
+            return False
+        with self._produce_lock:
+            if self._shm is not None and self._shm_put(opcode, aux, x, y):
+                return True
+            head = self._head
+            slot = self._slots[head & _RING_MASK]
+            entry = _STATIC_FRAMES.get((opcode, aux))
+            if entry is not None:
+                slot[:] = entry  # Preformatted click/press/release bytes
+            else:
+                _FRAME.pack_into(slot, 0, opcode, aux, _clamp_i16(x), _clamp_i16(y))
+            self._head = head + 1
+        self._wake.set()
+        return True
     
     def connect(self, port: str = "") -> bool:
         """
@@ -129,33 +555,71 @@ class MakcuCppWrapper:
             True if connected successfully
         """
         try:
+            if self._lib is not None:
+                if self._lib.mk_connect(port.encode()):
+                    self.connected = True
+                    self.port = port
+                    self._lib.mk_enable_high_performance(True)
+                    # Specialize the hot ops for the session: cache the
+                    # raw FFI entry points and shadow the guarded methods
+                    # with direct calls (disconnect() removes the shadows)
+                    self._mk_move = self._lib.mk_move
+                    self._mk_click = self._lib.mk_click
+                    self._mk_scroll = self._lib.mk_scroll
+                    self.move = self._move_lib
+                    self.click = self._click_lib
+                    self.scroll = self._scroll_lib
+                    _logger.info("Connected to %s (in-process ctypes binding)",
+                                 port or "auto-detected port")
+                    return True
+                _logger.warning("Connection failed via shared library")
+                return False
+
+            self._start_process()
+
             cmd = f"connect:{port}" if port else "connect"
-            response = self._execute_command(cmd, expect_response=True)
+            # Device discovery and serial open take real time - give the
+            # connect handshake a generous window, unlike status queries
+            response = self._execute_command(cmd, expect_response=True,
+                                             response_timeout=2.0)
             
             if response and "connected" in response.lower():
                 self.connected = True
                 self.port = port
                 
-                # Enable high-performance mode for gaming
-                self._execute_command("enable_high_performance:true")
+                # Enable high-performance mode for gaming. The child
+                # acks with "high_performance:enabled" - consume it, or
+                # the stale line poisons the next expect_response read
+                # (e.g. the handshake of a later reconnect).
+                self._execute_command("enable_high_performance:true",
+                                      expect_response=True)
                 
-                print(f"[MAKCU] Connected successfully to {port or 'auto-detected port'}")
-                print("[MAKCU] High-performance mode enabled (0.07ms movements)")
+                _logger.info("Connected to %s, high-performance mode enabled",
+                             port or "auto-detected port")
                 return True
             else:
-                print(f"[MAKCU] Connection failed: {response}")
+                _logger.warning("Connection failed: %s", response)
                 return False
                 
         except Exception as e:
-            print(f"[MAKCU] Connection error: {e}")
+            _logger.error("Connection error: %s", e)
             return False
     
     def disconnect(self) -> None:
         """Disconnect from MAKCU device"""
         if self.connected:
-            self._execute_command("disconnect")
+            if self._lib is not None:
+                self._lib.mk_disconnect()
+            else:
+                # Consume the "disconnected" ack so it cannot linger on
+                # the pipe and corrupt a later response read
+                self._execute_command("disconnect", expect_response=True)
             self.connected = False
-            print("[MAKCU] Disconnected")
+            # Drop the connected-path shadows, guarded methods take over
+            for name in ("move", "click", "scroll"):
+                self.__dict__.pop(name, None)
+            _logger.info("Disconnected")
+        self._stop_process()
     
     def move(self, x: int, y: int) -> bool:
         """
@@ -172,11 +636,143 @@ class MakcuCppWrapper:
         """
         if not self.connected:
             return False
-        
-        # Fire-and-forget command for maximum performance
-        self._execute_command(f"move:{x},{y}")
+
+        if self._lib is not None:
+            # Single FFI call - ctypes releases the GIL for the duration
+            return bool(self._lib.mk_move(_clamp_i16(x), _clamp_i16(y)))
+
+        # Slot write inlined rather than routed through _send_frame so
+        # the most frequent operation costs a single Python frame. The
+        # producer lock serializes the head read-pack-bump against other
+        # caller threads; it is never held across I/O, only the store.
+        if self._writer is None:
+            return False
+        with self._produce_lock:
+            if self._shm is not None and self._shm_put(_OP_MOVE, 0, x, y):
+                return True
+            head = self._head
+            _FRAME.pack_into(self._slots[head & _RING_MASK], 0,
+                             _OP_MOVE, 0, _clamp_i16(x), _clamp_i16(y))
+            self._head = head + 1
+        self._wake.set()
         return True
-    
+
+    def _move_lib(self, x: int, y: int) -> bool:
+        """Direct FFI hot path, installed as self.move by connect().
+
+        The connected flag and the transport branch in move() are
+        invariant for the whole session, so the ctypes connect path
+        shadows move with this single-call version: one cached FFI
+        pointer, no guards, GIL released by ctypes for the call.
+        """
+        return bool(self._mk_move(_clamp_i16(x), _clamp_i16(y)))
+
+    def _click_lib(self, button: int = LEFT) -> bool:
+        """Direct FFI click, installed as self.click by connect()"""
+        if type(button) is not int:
+            button = button.value  # MouseButton compatibility
+        return bool(self._mk_click(button))
+
+    def _scroll_lib(self, delta: int) -> bool:
+        """Direct FFI scroll, installed as self.scroll by connect()"""
+        return bool(self._mk_scroll(_clamp_i16(delta)))
+
+    def move_packed(self, packed: int) -> bool:
+        """
+        Move using both deltas packed into one 32-bit word.
+
+        Layout: (x & 0xFFFF) | ((y & 0xFFFF) << 16), both halves int16.
+        For callers that already hold packed coordinates (precomputed
+        paths, wire formats) this marshals one FFI argument instead of
+        two; anyone starting from separate x/y should call move(),
+        since packing in Python costs more than it saves.
+        """
+        if not self.connected:
+            return False
+
+        if self._lib is not None:
+            return bool(self._lib.mk_move_packed(packed & 0xFFFFFFFF))
+
+        # Pipe transport: frames carry x/y separately, so unpack with
+        # sign extension and queue a normal move
+        x = packed & 0xFFFF
+        y = (packed >> 16) & 0xFFFF
+        if x >= 0x8000:
+            x -= 0x10000
+        if y >= 0x8000:
+            y -= 0x10000
+        return self.move(x, y)
+
+    async def move_async(self, x: int, y: int) -> bool:
+        """
+        Asyncio-friendly movement for event-loop based pipelines.
+
+        The serial port itself is owned by the C++ layer, so there is no
+        pyserial stream to make async here. On the pipe transport move()
+        is already submit-and-return (ring append, writer thread does the
+        I/O); on the ctypes path the FFI call is pushed to the default
+        executor so the event loop never blocks on a serial write.
+
+        Thread-based callers can schedule this with
+        asyncio.run_coroutine_threadsafe() from the AI thread.
+        """
+        if self._lib is not None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.move, x, y)
+        return self.move(x, y)
+
+    def move_path(self, deltas) -> bool:
+        """
+        Send an entire movement path in one call.
+
+        Per-call overhead is paid once for the whole path: on the ctypes
+        transport the packed array goes through a single mk_move_path FFI
+        call, and on the pipe transport the batch ships as one write
+        (OP_BATCH_MOVE header followed by the raw i16 pairs).
+
+        Args:
+            deltas: Sequence of (dx, dy) pairs
+
+        Returns:
+            True if the batch was sent
+        """
+        if not self.connected:
+            return False
+
+        flat = array('h')
+        for dx, dy in deltas:
+            flat.append(_clamp_i16(int(dx)))
+            flat.append(_clamp_i16(int(dy)))
+        count = len(flat) // 2
+        if count == 0:
+            return True
+
+        if self._lib is not None:
+            buf = (ctypes.c_int16 * len(flat)).from_buffer(flat)
+            return bool(self._lib.mk_move_path(buf, count))
+
+        if sys.byteorder == 'big':
+            flat.byteswap()  # Wire format is little-endian
+
+        # Batches bypass the slot ring (their payload is variable size);
+        # drain first so earlier queued frames keep their ordering
+        self._drain_ring()
+        try:
+            with self._lock:
+                if self._proc is None or self._proc.poll() is not None:
+                    return False
+                # The header count is an i16, so very long paths ship in chunks
+                for start in range(0, count, 32767):
+                    chunk = flat[2 * start:2 * (start + 32767)]
+                    os.write(self._stdin_fd,
+                             _FRAME.pack(_OP_BATCH_MOVE, 0, len(chunk) // 2, 0)
+                             + chunk.tobytes())
+                return True
+        except (subprocess.SubprocessError, OSError, ValueError) as e:
+            self._errors += 1
+            _logger.debug("Batch write failed: %s", e)
+            return False
+
     def move_smooth(self, x: int, y: int, segments: int = 10) -> bool:
         """
         Smooth interpolated mouse movement.
@@ -191,42 +787,65 @@ class MakcuCppWrapper:
         """
         if not self.connected:
             return False
-            
-        self._execute_command(f"move_smooth:{x},{y},{segments}")
+
+        if self._lib is not None:
+            return bool(self._lib.mk_move_smooth(
+                _clamp_i16(x), _clamp_i16(y), min(segments, 255)))
+
+        self._send_frame(_OP_MOVE_SMOOTH, min(segments, 255), x, y)
         return True
     
-    def click(self, button: MouseButton = MouseButton.LEFT) -> bool:
+    def click(self, button: int = LEFT) -> bool:
         """
         Fast mouse click (press + release).
-        
+
         Args:
-            button: Mouse button to click
-            
+            button: Button code (LEFT/RIGHT/... int constants; MouseButton
+                    members are accepted for compatibility)
+
         Returns:
             True if command sent
-            
+
         Performance: ~0.16ms average execution time
         """
         if not self.connected:
             return False
-            
-        self._execute_command(f"click:{button.value}")
+
+        if type(button) is not int:
+            button = button.value  # MouseButton compatibility
+
+        if self._lib is not None:
+            return bool(self._lib.mk_click(button))
+
+        self._send_frame(_OP_CLICK, button)
         return True
     
-    def press(self, button: MouseButton) -> bool:
+    def press(self, button: int = LEFT) -> bool:
         """Press mouse button down"""
         if not self.connected:
             return False
-            
-        self._execute_command(f"press:{button.value}")
+
+        if type(button) is not int:
+            button = button.value  # MouseButton compatibility
+
+        if self._lib is not None:
+            return bool(self._lib.mk_press(button))
+
+        self._send_frame(_OP_PRESS, button)
         return True
-    
-    def release(self, button: MouseButton) -> bool:
+
+    def release(self, button: int = LEFT) -> bool:
         """Release mouse button"""
         if not self.connected:
             return False
-            
-        self._execute_command(f"release:{button.value}")
+
+        if type(button) is not int:
+            button = button.value  # MouseButton compatibility
+
+        if self._lib is not None:
+            return bool(self._lib.mk_release(button))
+
+        self._send_frame(_OP_RELEASE, button)
         return True
     
     def scroll(self, delta: int) -> bool:
@@ -243,15 +862,21 @@ class MakcuCppWrapper:
         """
         if not self.connected:
             return False
-            
-        self._execute_command(f"scroll:{delta}")
+
+        if self._lib is not None:
+            return bool(self._lib.mk_scroll(_clamp_i16(delta)))
+
+        self._send_frame(_OP_SCROLL, 0, delta)
         return True
     
     def lock_mouse_x(self, lock: bool = True) -> bool:
         """Lock/unlock horizontal mouse movement"""
         if not self.connected:
             return False
-            
+
+        if self._lib is not None:
+            return bool(self._lib.mk_lock_x(lock))
+
         self._execute_command(f"lock_x:{1 if lock else 0}")
         return True
     
@@ -259,14 +884,48 @@ class MakcuCppWrapper:
         """Lock/unlock vertical mouse movement"""  
         if not self.connected:
             return False
-            
+
+        if self._lib is not None:
+            return bool(self._lib.mk_lock_y(lock))
+
         self._execute_command(f"lock_y:{1 if lock else 0}")
         return True
     
     def is_connected(self) -> bool:
-        """Check if device is connected"""
-        return self.connected
-    
+        """Check if device is connected.
+
+        Probes the transport rather than trusting the cached flag: on
+        the ctypes binding the device is process-global, so another
+        wrapper in the same process can tear it down behind our back;
+        on the pipe transport the child can die. A dead connection
+        resyncs self.connected so callers can reconnect cleanly.
+        """
+        if not self.connected:
+            return False
+
+        if self._lib is not None:
+            alive = bool(self._lib.mk_is_connected())
+        else:
+            alive = (self._proc is not None and self._proc.poll() is None
+                     and self._execute_command(
+                         "status", expect_response=True) == "connected")
+
+        if not alive:
+            self.connected = False
+            # Drop the connected-path shadows, guarded methods take over
+            for name in ("move", "click", "scroll"):
+                self.__dict__.pop(name, None)
+        return alive
+
+    def get_stats(self) -> dict:
+        """Runtime counters for diagnostics. Cheap, lock-free reads."""
+        return {
+            "transport": "ctypes" if self._lib is not None else "pipe",
+            "connected": self.connected,
+            "errors": self._errors,
+            "queued": self._head - self._tail,
+        }
+
     def get_status(self) -> str:
         """Get connection status"""
         if self.connected:
@@ -297,10 +956,34 @@ class MakcuControllerReplacement:
     - Zero-delay command execution
     """
     
+    # Moves landing within this window are merged into one delta before
+    # hitting the transport (aim loops often call move() several times
+    # per frame)
+    _COALESCE_WINDOW = 0.0002  # 200µs
+
+    # Fixed attribute layout: no per-instance __dict__, so every
+    # self.<attr> read in the hot path hits a slot descriptor instead
+    # of a dict probe. 'move' is itself a slot rather than a method -
+    # connect()/disconnect() bind it to the path matching the
+    # connection state, which slots make explicit.
+    __slots__ = ('makcu', 'connected', 'move', '_makcu_move',
+                 '_pending_x', '_pending_y', '_deadline',
+                 '_flush_timer', '_pending_lock')
+
     def __init__(self):
         self.makcu = None
         self.connected = False
-        
+        self.move = self._move_disconnected
+        self._makcu_move = None  # Bound transport move, cached on connect
+
+        # Burst coalescer state: accumulated delta, the end of the
+        # current merge window, and the one-shot flush timer
+        self._pending_x = 0
+        self._pending_y = 0
+        self._deadline = 0.0
+        self._flush_timer = None
+        self._pending_lock = threading.Lock()
+
     def connect(self) -> bool:
         """
         Connect to MAKCU device using C++ high-performance library.
@@ -312,53 +995,95 @@ class MakcuControllerReplacement:
             self.makcu = MakcuCppWrapper()
             if self.makcu.connect():
                 self.connected = True
-                print("[MAKCU] High-performance C++ controller initialized")
-                print("[MAKCU] Performance: 0.07ms movements, 0.16ms clicks")
+                # Specialize: connected state is invariant for the
+                # session, so bind the guard-free hot path and cache
+                # the transport's bound move for the flush path
+                self._makcu_move = self.makcu.move
+                self.move = self._move_connected
+                _logger.info("High-performance C++ controller initialized")
                 return True
             else:
-                print("[MAKCU] Failed to connect via C++ library")
+                _logger.warning("Failed to connect via C++ library")
                 return False
         except Exception as e:
-            print(f"[MAKCU] C++ wrapper initialization failed: {e}")
+            _logger.error("C++ wrapper initialization failed: %s", e)
             return False
     
-    def move(self, x: int, y: int) -> bool:
-        """
-        Ultra-fast mouse movement for AI aiming.
-        
-        This is the main function called by BetterAifinal.py for mouse movement.
-        Provides 28x performance improvement over Python implementation.
-        
+    def _move_connected(self, x: int, y: int) -> bool:
+        """Ultra-fast mouse movement for AI aiming.
+
+        This is the main function called by BetterAifinal.py (as
+        controller.move). The move slot is bound here by connect() and
+        to _move_disconnected otherwise, so there is no per-call
+        connected/makcu guard anywhere on the hot path.
+
         Args:
             x: Horizontal movement delta
             y: Vertical movement delta
-            
+
         Returns:
             True if movement executed successfully
         """
-        if not self.connected or not self.makcu:
-            return False
-        
-        return self.makcu.move(int(x), int(y))
+        now = time.perf_counter()
+        with self._pending_lock:
+            self._pending_x += int(x)
+            self._pending_y += int(y)
+
+            if now >= self._deadline:
+                # First move of a burst: send immediately and open a
+                # merge window for the calls right behind it
+                self._deadline = now + self._COALESCE_WINDOW
+                return self._flush_locked()
+
+            # Inside the window: accumulate, let the timer flush
+            if self._flush_timer is None:
+                timer = threading.Timer(self._COALESCE_WINDOW, self._flush)
+                timer.daemon = True
+                self._flush_timer = timer
+                timer.start()
+        return True
+
+    def _flush_locked(self) -> bool:
+        """Send the accumulated delta. Caller holds _pending_lock."""
+        x, y = self._pending_x, self._pending_y
+        self._pending_x = self._pending_y = 0
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if x or y:
+            return self._makcu_move(x, y)
+        return True
+
+    def _flush(self) -> bool:
+        """Flush any pending coalesced movement to the transport"""
+        if self.makcu is None:
+            return True
+        with self._pending_lock:
+            return self._flush_locked()
+
+    def _move_disconnected(self, x: int, y: int) -> bool:
+        """Installed as self.move after disconnect()"""
+        return False
     
     def click(self, button: str = "left") -> bool:
         """Click mouse button"""
         if not self.connected or not self.makcu:
             return False
-        
-        button_map = {
-            "left": MouseButton.LEFT,
-            "right": MouseButton.RIGHT, 
-            "middle": MouseButton.MIDDLE
-        }
-        
-        return self.makcu.click(button_map.get(button, MouseButton.LEFT))
+
+        self._flush()  # Pending movement must land before the click
+
+        if button == "left":
+            return self.makcu.click(LEFT)  # Common case skips the dict
+
+        return self.makcu.click(_BUTTONS.get(button, LEFT))
     
     def disconnect(self):
         """Disconnect from device"""
         if self.makcu:
+            self._flush()
             self.makcu.disconnect()
             self.connected = False
+            self.move = self._move_disconnected
     
     def __del__(self):
         """Cleanup on destruction"""
@@ -387,55 +1112,77 @@ def performance_test():
     the documented specifications.
     """
     print("=== MAKCU C++ Performance Test ===")
-    
+
+    # Plain connect + try/finally instead of a context manager: setup
+    # and teardown stay clearly outside every timed window. The
+    # constructor raises on an unbuilt tree, so it sits inside the try
+    # and the finally guards against a wrapper that never existed.
+    makcu = None
     try:
-        with MakcuCppWrapper() as makcu:
-            if not makcu.connect():
-                print("Failed to connect to MAKCU device")
-                return
-            
-            # Test rapid movements
-            print("Testing 100 rapid mouse movements...")
-            start_time = time.perf_counter()
-            
-            for i in range(100):
-                makcu.move(1, 0)
-                makcu.move(-1, 0)
-            
-            end_time = time.perf_counter()
-            total_ms = (end_time - start_time) * 1000
-            avg_ms = total_ms / 100
-            
-            print(f"100 movements: {total_ms:.1f}ms ({avg_ms:.3f}ms avg)")
-            
-            # Test rapid clicks  
-            print("Testing 50 rapid clicks...")
-            start_time = time.perf_counter()
-            
-            for i in range(50):
-                makcu.click(MouseButton.LEFT)
-            
-            end_time = time.perf_counter()
-            total_ms = (end_time - start_time) * 1000
-            avg_ms = total_ms / 50
-            
-            print(f"50 clicks: {total_ms:.1f}ms ({avg_ms:.3f}ms avg)")
-            
-            # Gaming suitability check
-            print("\n=== Gaming Performance Analysis ===")
-            frame_times = {
-                "360Hz": 2.8,
-                "240Hz": 4.2, 
-                "144Hz": 6.9
-            }
-            
-            for refresh_rate, frame_time in frame_times.items():
-                suitable = avg_ms < frame_time
-                status = "✅ EXCELLENT" if suitable else "⚠️  MARGINAL"
-                print(f"{refresh_rate} Gaming: {status} (frame: {frame_time}ms, avg: {avg_ms:.3f}ms)")
+        makcu = MakcuCppWrapper()
+        if not makcu.connect():
+            print("Failed to connect to MAKCU device")
+            return
+
+        # Prebind the methods under test so attribute lookups don't
+        # end up inside the timed windows
+        move = makcu.move
+        click = makcu.click
+        perf_ns = time.perf_counter_ns
+
+        # Test rapid movements (integer ns clock - at a 0.07ms
+        # budget, float perf_counter rounding is visible)
+        print("Testing 100 rapid mouse movements...")
+        start_ns = perf_ns()
+
+        for i in range(100):
+            move(1, 0)
+            move(-1, 0)
+
+        total_ms = (perf_ns() - start_ns) / 1e6
+        avg_ms = total_ms / 100
+
+        print(f"100 movements: {total_ms:.1f}ms ({avg_ms:.3f}ms avg)")
+
+        # Batched path for comparison: one call, no per-point Python
+        # loop, so the interpreter's share is not billed as transport
+        path = [(1, 0), (-1, 0)] * 100
+        start_ns = perf_ns()
+        makcu.move_path(path)
+        batch_ms = (perf_ns() - start_ns) / 1e6
+        print(f"200-point move_path: {batch_ms:.1f}ms "
+              f"({batch_ms / 200:.4f}ms per point)")
+
+        # Test rapid clicks
+        print("Testing 50 rapid clicks...")
+        start_ns = perf_ns()
+
+        for i in range(50):
+            click(LEFT)
+
+        total_ms = (perf_ns() - start_ns) / 1e6
+        avg_ms = total_ms / 50
+
+        print(f"50 clicks: {total_ms:.1f}ms ({avg_ms:.3f}ms avg)")
+        
+        # Gaming suitability check
+        print("\n=== Gaming Performance Analysis ===")
+        frame_times = {
+            "360Hz": 2.8,
+            "240Hz": 4.2, 
+            "144Hz": 6.9
+        }
+        
+        for refresh_rate, frame_time in frame_times.items():
+            suitable = avg_ms < frame_time
+            status = "✅ EXCELLENT" if suitable else "⚠️  MARGINAL"
+            print(f"{refresh_rate} Gaming: {status} (frame: {frame_time}ms, avg: {avg_ms:.3f}ms)")
     
     except Exception as e:
         print(f"Performance test failed: {e}")
+    finally:
+        if makcu is not None:
+            makcu.disconnect()
 
 
 if __name__ == "__main__":
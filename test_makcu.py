@@ -7,10 +7,42 @@ This script provides detailed testing of the MAKCU C++ integration
 with step-by-step verification and performance measurement.
 """
 
+import os
 import time
 import sys
+from array import array
 from makcu_python_wrapper import MakcuCppWrapper, MakcuControllerReplacement
 
+# Shared wrapper fixture: every test runs against the same instance so
+# the device open/handshake happens once for the whole suite and the
+# benchmarks measure a warmed-up transport instead of first-call cost.
+# main() connects it up front and disconnects once at the end.
+_GLOBAL_WRAPPER = None
+
+# Per-run (test_name, avg_ms) samples from performance_benchmark, kept
+# across repeated runs (MAKCU_BENCH_REPEATS) for mean/stddev reporting
+_BENCH_HISTORY = []
+
+def _wrapper():
+    """Return the shared MakcuCppWrapper, creating it on first use"""
+    global _GLOBAL_WRAPPER
+    if _GLOBAL_WRAPPER is None:
+        _GLOBAL_WRAPPER = MakcuCppWrapper()
+    return _GLOBAL_WRAPPER
+
+def _connected_wrapper():
+    """Shared wrapper, connected (no-op if already connected).
+
+    Liveness is checked with is_connected() - a real transport probe -
+    rather than the cached flag, so a test that tears the device down
+    behind the session (the ctypes transport is one device per process)
+    gets a reconnect here instead of a dead session.
+    """
+    wrapper = _wrapper()
+    if not wrapper.is_connected():
+        wrapper.connect()
+    return wrapper
+
 def test_cli_interface():
     """Test the CLI interface directly"""
     print("=" * 50)
@@ -18,25 +50,31 @@ def test_cli_interface():
     print("=" * 50)
     
     try:
-        wrapper = MakcuCppWrapper()
+        wrapper = _wrapper()
         print(f"✅ CLI executable found at: {wrapper.exe_path}")
-        
+
         # Test connection
         print("\nTesting connection...")
-        if wrapper.connect():
+        if wrapper.is_connected() or wrapper.connect():
             print("✅ Connection successful")
             print(f"✅ Status: {wrapper.get_status()}")
             
-            # Test movements
+            # Test movements (integer ns clock - at a sub-0.1ms budget,
+            # float perf_counter rounding is visible)
             print("\nTesting movements...")
-            start_time = time.perf_counter()
-            
+
+            # Discarded warmup burst: the first calls pay cold-cache
+            # and transport wakeup costs that steady state does not
+            for _ in range(20):
+                wrapper.move(0, 0)
+
+            start_ns = time.perf_counter_ns()
+
             for i in range(10):
                 wrapper.move(i, 0)
                 wrapper.move(-i, 0)
-            
-            end_time = time.perf_counter()
-            duration_ms = (end_time - start_time) * 1000
+
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
             avg_ms = duration_ms / 20
             
             print(f"✅ 20 movements completed in {duration_ms:.2f}ms")
@@ -55,10 +93,8 @@ def test_cli_interface():
             wrapper.scroll(3)
             wrapper.scroll(-3)
             print("✅ Click and scroll tests completed")
-            
-            wrapper.disconnect()
-            print("✅ Disconnected successfully")
-            
+            print("✅ Connection left open for remaining tests")
+
         else:
             print("❌ Connection failed")
             return False
@@ -87,25 +123,30 @@ def test_controller_replacement():
             
             # Test the move function (main function used by BetterAifinal.py)
             print("\nTesting move function (used by AI)...")
-            start_time = time.perf_counter()
-            
-            # Simulate AI movements
-            movements = [
-                (10, 5), (-10, -5), (15, -3), (-15, 3),
-                (5, 10), (-5, -10), (8, -8), (-8, 8)
-            ]
-            
-            for x, y in movements:
-                success = controller.move(x, y)
+
+            # Simulated AI movements as parallel int16 arrays instead
+            # of a list of tuples: no tuple unpacking or re-boxing per
+            # iteration, just two indexed reads of unboxed values
+            xs = array('h', [10, -10, 15, -15, 5, -5, 8, -8])
+            ys = array('h', [5, -5, -3, 3, 10, -10, -8, 8])
+
+            # Warm the path before timing - first-call costs are not
+            # what the AI loop sees in steady state
+            for _ in range(20):
+                controller.move(0, 0)
+
+            start_ns = time.perf_counter_ns()
+
+            for i in range(len(xs)):
+                success = controller.move(xs[i], ys[i])
                 if not success:
-                    print(f"❌ Movement failed: ({x}, {y})")
+                    print(f"❌ Movement failed: ({xs[i]}, {ys[i]})")
                     return False
-            
-            end_time = time.perf_counter()
-            duration_ms = (end_time - start_time) * 1000
-            avg_ms = duration_ms / len(movements)
-            
-            print(f"✅ {len(movements)} AI movements completed in {duration_ms:.2f}ms")
+
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+            avg_ms = duration_ms / len(xs)
+
+            print(f"✅ {len(xs)} AI movements completed in {duration_ms:.2f}ms")
             print(f"✅ Average: {avg_ms:.3f}ms per movement")
             
             # Gaming performance analysis
@@ -116,10 +157,12 @@ def test_controller_replacement():
                 ("144Hz", 6.9)
             ]
             
-            for name, frame_time in refresh_rates:
-                suitable = avg_ms < frame_time
-                status = "✅ PERFECT" if suitable else "❌ TOO SLOW"
-                print(f"  {name}: {status} (frame: {frame_time}ms, avg: {avg_ms:.3f}ms)")
+            # Single joined print: one buffer, one flush for the table
+            print("\n".join(
+                f"  {name}: "
+                f"{'✅ PERFECT' if avg_ms < frame_time else '❌ TOO SLOW'} "
+                f"(frame: {frame_time}ms, avg: {avg_ms:.3f}ms)"
+                for name, frame_time in refresh_rates))
             
             controller.disconnect()
             print("\n✅ Controller test completed successfully")
@@ -141,52 +184,87 @@ def performance_benchmark():
     print("=" * 50)
     
     try:
-        with MakcuCppWrapper() as makcu:
-            if not makcu.connect():
-                print("❌ Cannot connect for performance test")
-                return False
-            
-            tests = [
-                ("Rapid Movements", lambda: [makcu.move(i%5, i%5) for i in range(100)], 100),
-                ("Rapid Clicks", lambda: [makcu.click() for _ in range(50)], 50),
-                ("Mixed Operations", lambda: [
-                    makcu.move(5, 0), makcu.click(), makcu.move(-5, 0),
-                    makcu.scroll(1), makcu.move(0, 5), makcu.click(), 
-                    makcu.move(0, -5), makcu.scroll(-1)
-                ], 8),
-            ]
-            
-            print("Running performance tests...\n")
-            
-            for test_name, test_func, operation_count in tests:
-                print(f"Testing {test_name}...")
-                
-                start_time = time.perf_counter()
-                test_func()
-                end_time = time.perf_counter()
-                
-                duration_ms = (end_time - start_time) * 1000
-                avg_ms = duration_ms / operation_count
-                ops_per_sec = operation_count / (duration_ms / 1000)
-                
-                print(f"  Total: {duration_ms:.2f}ms")
-                print(f"  Average: {avg_ms:.3f}ms per operation")
-                print(f"  Throughput: {ops_per_sec:.0f} ops/sec")
-                
-                # Performance rating
-                if avg_ms < 0.1:
-                    rating = "🚀 EXCEPTIONAL"
-                elif avg_ms < 0.5:
-                    rating = "✅ EXCELLENT"
-                elif avg_ms < 1.0:
-                    rating = "✅ GOOD"
-                else:
-                    rating = "⚠️  NEEDS OPTIMIZATION"
-                
-                print(f"  Rating: {rating}\n")
-            
-            print("🏆 Performance benchmark completed!")
-            
+        makcu = _connected_wrapper()
+        if not makcu.connected:
+            print("❌ Cannot connect for performance test")
+            return False
+
+        # The 100 (i%5, i%5) deltas, computed once up front - the
+        # index math is benchmark setup, not the op under test, so
+        # it stays out of the timed region. "Batched Movements"
+        # ships the same list through move_path in a single call.
+        move_deltas = [(i%5, i%5) for i in range(100)]
+
+        # Explicit helpers instead of lambdas: each prebinds the
+        # bound method to a local so the timed loop skips the
+        # attribute lookup on every iteration
+        def _rapid_move():
+            mv = makcu.move
+            for x, y in move_deltas:
+                mv(x, y)
+
+        def _batched_move():
+            makcu.move_path(move_deltas)
+
+        def _rapid_click():
+            ck = makcu.click
+            for _ in range(50):
+                ck()
+
+        def _mixed():
+            mv, ck, sc = makcu.move, makcu.click, makcu.scroll
+            mv(5, 0); ck(); mv(-5, 0); sc(1)
+            mv(0, 5); ck(); mv(0, -5); sc(-1)
+
+        tests = [
+            ("Rapid Movements", _rapid_move, 100),
+            ("Batched Movements", _batched_move, 100),
+            ("Rapid Clicks", _rapid_click, 50),
+            ("Mixed Operations", _mixed, 8),
+        ]
+        
+        print("Running performance tests...\n")
+
+        # Results are buffered and emitted in one print after all the
+        # tests have run, so console writes (and their flushes) never
+        # land between or inside the timed regions
+        report = []
+
+        warm = makcu.move
+        for test_name, test_func, operation_count in tests:
+            # Discarded warmup burst so each measurement starts from
+            # steady state rather than cold caches
+            for _ in range(20):
+                warm(0, 0)
+
+            start_ns = time.perf_counter_ns()
+            test_func()
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+            avg_ms = duration_ms / operation_count
+            ops_per_sec = operation_count / (duration_ms / 1000)
+            _BENCH_HISTORY.append((test_name, avg_ms))
+
+            # Performance rating
+            if avg_ms < 0.1:
+                rating = "🚀 EXCEPTIONAL"
+            elif avg_ms < 0.5:
+                rating = "✅ EXCELLENT"
+            elif avg_ms < 1.0:
+                rating = "✅ GOOD"
+            else:
+                rating = "⚠️  NEEDS OPTIMIZATION"
+
+            report.append(
+                f"Testing {test_name}...\n"
+                f"  Total: {duration_ms:.2f}ms\n"
+                f"  Average: {avg_ms:.3f}ms per operation\n"
+                f"  Throughput: {ops_per_sec:.0f} ops/sec\n"
+                f"  Rating: {rating}\n"
+            )
+
+        print("\n".join(report))
+        print("🏆 Performance benchmark completed!")
+        
     except Exception as e:
         print(f"❌ Performance benchmark failed: {e}")
         return False
@@ -199,27 +277,29 @@ def integration_verification():
     print("INTEGRATION VERIFICATION")
     print("=" * 50)
     
+    try:
+        exe_ok = _wrapper().exe_path != ""
+    except Exception:
+        exe_ok = False
+
+    connected, high_perf, fire_and_forget = _full_verify()
+
     checks = [
-        ("CLI executable exists", lambda: MakcuCppWrapper().exe_path != ""),
-        ("Python wrapper imports", lambda: True),  # Already imported if we got here
-        ("Device connection works", lambda: test_device_connection()),
-        ("High-performance mode", lambda: test_high_performance()),
-        ("Fire-and-forget mode", lambda: test_fire_and_forget()),
+        ("CLI executable exists", exe_ok),
+        ("Python wrapper imports", True),  # Already imported if we got here
+        ("Device connection works", connected),
+        ("High-performance mode", high_perf),
+        ("Fire-and-forget mode", fire_and_forget),
     ]
-    
+
     all_passed = True
-    
-    for check_name, check_func in checks:
-        try:
-            result = check_func()
-            status = "✅ PASS" if result else "❌ FAIL"
-            print(f"{status}: {check_name}")
-            if not result:
-                all_passed = False
-        except Exception as e:
-            print(f"❌ FAIL: {check_name} - {e}")
+
+    for check_name, result in checks:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{status}: {check_name}")
+        if not result:
             all_passed = False
-    
+
     print("\n" + "=" * 50)
     if all_passed:
         print("🎉 INTEGRATION VERIFICATION PASSED!")
@@ -231,45 +311,31 @@ def integration_verification():
     
     return all_passed
 
-def test_device_connection():
-    """Quick device connection test"""
-    try:
-        with MakcuCppWrapper() as makcu:
-            return makcu.connect()
-    except:
-        return False
+def _full_verify():
+    """Probe connection, high-performance mode and fire-and-forget
+    latency in a single pass over the shared session.
 
-def test_high_performance():
-    """Test high-performance mode activation"""
+    Returns a (connected, high_performance, fire_and_forget) tuple for
+    integration_verification to report as named checks.
+    """
     try:
-        wrapper = MakcuCppWrapper()
-        if wrapper.connect():
-            # Connection itself enables high-performance mode
-            wrapper.disconnect()
-            return True
-        return False
-    except:
-        return False
+        wrapper = _connected_wrapper()
+        if not wrapper.connected:
+            return False, False, False
 
-def test_fire_and_forget():
-    """Test fire-and-forget command execution"""
-    try:
-        wrapper = MakcuCppWrapper()
-        if wrapper.connect():
-            # Fire-and-forget commands return immediately
-            start = time.perf_counter()
-            wrapper.move(1, 1)
-            end = time.perf_counter()
-            duration_ms = (end - start) * 1000
-            wrapper.disconnect()
-            
-            # Should be very fast (< 1ms for fire-and-forget)
-            return duration_ms < 1.0
-        return False
+        # connect() enables high-performance mode as part of the
+        # handshake, so a live connection implies both
+
+        # Fire-and-forget commands should return in well under 1ms
+        start_ns = time.perf_counter_ns()
+        wrapper.move(1, 1)
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+        return True, True, duration_ms < 1.0
     except:
-        return False
+        return False, False, False
 
-def main():
+def main(prompt=True):
     """Run all tests"""
     print("MAKCU C++ Integration - Comprehensive Test Suite")
     print("=" * 60)
@@ -282,8 +348,20 @@ def main():
     print("Please ensure your MAKCU device is connected via USB")
     print("VID:PID should be 1A86:55D3")
     
-    input("\nPress Enter when ready to start testing...")
-    
+    # Only prompt a human at an interactive terminal - under CI or a
+    # perf harness (piped stdin, or --no-prompt) start straight away
+    if prompt and sys.stdin.isatty() and "--no-prompt" not in sys.argv:
+        input("\nPress Enter when ready to start testing...")
+
+    # Connect the shared wrapper once; every test reuses this session.
+    # On a fresh checkout with nothing built the wrapper constructor
+    # raises - report it and let each test fail individually instead
+    # of killing the whole suite before any result is printed.
+    try:
+        _connected_wrapper()
+    except Exception as e:
+        print(f"\n⚠️  Could not set up shared session: {e}")
+
     # Run all tests
     tests = [
         ("CLI Interface", test_cli_interface),
@@ -302,7 +380,10 @@ def main():
         except Exception as e:
             print(f"❌ {test_name} failed with exception: {e}")
             results.append((test_name, False))
-    
+
+    if _GLOBAL_WRAPPER is not None:
+        _GLOBAL_WRAPPER.disconnect()
+
     # Summary
     print("\n" + "=" * 60)
     print("TEST SUMMARY")
@@ -330,6 +411,32 @@ def main():
     
     return passed == total
 
+def _print_benchmark_aggregate(repeats):
+    """Mean/stddev of each benchmark's avg_ms across repeated runs"""
+    from statistics import mean, stdev
+
+    by_test = {}
+    for name, avg in _BENCH_HISTORY:
+        by_test.setdefault(name, []).append(avg)
+
+    print("\n" + "=" * 60)
+    print(f"BENCHMARK AGGREGATE ({repeats} runs)")
+    print("=" * 60)
+    for name, values in by_test.items():
+        spread = stdev(values) if len(values) > 1 else 0.0
+        print(f"{name}: mean {mean(values):.3f}ms, "
+              f"stddev {spread:.3f}ms per operation")
+
 if __name__ == "__main__":
-    success = main()
+    # MAKCU_BENCH_REPEATS=N runs the whole suite N times and reports
+    # mean/stddev per benchmark, so regressions show against a
+    # distribution instead of a single sample
+    repeats = int(os.environ.get("MAKCU_BENCH_REPEATS", "1"))
+    success = True
+    for run in range(repeats):
+        if repeats > 1:
+            print(f"\n{'#' * 20} RUN {run + 1}/{repeats} {'#' * 20}")
+        success = main(prompt=(run == 0)) and success
+    if repeats > 1:
+        _print_benchmark_aggregate(repeats)
     sys.exit(0 if success else 1)
\ No newline at end of file